@@ -9,6 +9,12 @@ from enum import auto
 from importlib import invalidate_caches
 import time
 import threading
+import argparse
+import collections
+import heapq
+import logging
+from functools import partial
+from operator import itemgetter
 import truck_telemetry
 from scscontroller import SCSController
 controller = SCSController()
@@ -21,42 +27,110 @@ except ImportError:
     print("Install with: pip install hidapi")
     exit(1)
 
-# lights
-light_state = 2 # 0=off, 1=parking, 2=low beam
-wiper_state = 0 # -1=manual, 0=off/sensor, 1=intermittent, 2=low, 3=high
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# telemetry keys read every loop, in unpack order
+_BLINK_KEYS = ("blinkerLeftActive", "blinkerLeftOn", "blinkerRightActive", "blinkerRightOn",
+               "lightsHazards", "lightsParking", "lightsBeamLow")
+# truck_telemetry returns a fixed-schema dict, so all keys can be fetched in one C call
+_read_blink_keys = itemgetter(*_BLINK_KEYS)
+
+# controller outputs for each wiper_state
+_WIPER_MAP = {
+    0: {'wipersback': False, 'wipers0': False, 'wipers1': False, 'tripreset': True},   # off
+    1: {'wipersback': True, 'wipers0': False, 'wipers1': False, 'tripreset': False},   # intermittent
+    2: {'wipersback': False, 'wipers0': True, 'wipers1': False, 'tripreset': False},   # low
+    3: {'wipersback': False, 'wipers0': False, 'wipers1': True, 'tripreset': False},   # high
+    -1: {'wipersback': False, 'wipers0': True, 'wipers1': False, 'tripreset': False},  # manual slow wipe
+}
+# wiper_state 0 with the rain sensor active
+_WIPER_SENSOR = {'wipersback': True, 'wipers0': False, 'wipers1': False, 'tripreset': False}
 
 
 class MOZAStalksMonitor:
+    __slots__ = (
+        'device', 'device_info', 'running', 'connected', 'thread', 'reader_thread',
+        'last_state', '_last_bits', 'data', '_connect_gen', '_ring', '_frame_ready', '_stop_event',
+        '_ctrl_state', '_pending_releases', '_pulse_ready',
+        'autodisable', 'autodisable_blinks', 'autodisable_threshold',
+        'report_size', 'reconnect_delay', 'max_read_errors', 'read_error_count', 'switch_cooldown',
+        '_printed_fallback',
+        'blink_count', 'indicator_state', 'prev_blinker_state', '_cooldown_deadline',
+        'right_cooldown', 'left_cooldown', 'light_state', 'wiper_state', 'rain_sensor',
+        '_button_handlers',
+    )
+
     def __init__(self):
         self.device = None
         self.device_info = None
         self.running = False
         self.connected = False
         self.thread = None
+        self.reader_thread = None
         self.last_state = None
+        self._last_bits = 0  # last_state as a little-endian int, one bit per button
         self.data = None
 
+        # HID frames handed from the reader thread to the processing thread, as
+        # (connection generation, frame). deque append/popleft are atomic, so no
+        # extra locking is needed.
+        self._connect_gen = 0  # bumped on every successful connect
+        self._ring = collections.deque(maxlen=16)
+        self._frame_ready = threading.Event()  # set by the reader after each push
+        self._stop_event = threading.Event()
+
+        # last value written to each controller output; None until the first write
+        self._ctrl_state = dict.fromkeys(
+            ('lblinker', 'rblinker', 'light', 'wipersback', 'wipers0', 'wipers1', 'tripreset'))
+        # heap of pulsed outputs waiting to be released, as (release time, [outputs])
+        self._pending_releases = []
+        self._pulse_ready = {}  # output -> time a new pulse is allowed
+
         self.autodisable = False
         self.autodisable_blinks = 3 # number of blinks to auto-disable when not locked
         self.autodisable_threshold = 1 # blinks
 
         # Connection management
+        self.report_size = 64       # bytes per HID input report
         self.reconnect_delay = 2.0  # seconds between reconnection attempts
         self.max_read_errors = 5    # max consecutive read errors before reconnecting
         self.read_error_count = 0
         self.switch_cooldown = 0.15  # seconds to ignore rapid turn signal changes
+        self._printed_fallback = False
 
         # running variables
         # turning signals
         self.blink_count = 0 # Number of blinks since last activated
         self.indicator_state = 0  # 0=off, 1=right, -1=left
         self.prev_blinker_state = False
-        self.last_turnsignal_time = 0
+        self._cooldown_deadline = 0.0  # time.monotonic() until which turn signal changes are ignored
         self.right_cooldown = False
         self.left_cooldown = False
+        # lights
+        self.light_state = 2  # 0=off, 1=parking, 2=low beam
         # wipers
+        self.wiper_state = 0  # -1=manual, 0=off/sensor, 1=intermittent, 2=low, 3=high
         self.rain_sensor = False
-        
+
+        # button id -> press handler
+        self._button_handlers = {
+            # indicators
+            7: self._btn_right,
+            9: self._btn_left,
+            8: self._btn_cancel,
+            # lights: off, parking, low beam
+            0: partial(self._set_light_state, 0),
+            1: partial(self._set_light_state, 1),
+            2: partial(self._set_light_state, 2),
+            # wipers: manual, off/sensor, intermittent, low, high
+            19: partial(self._set_wiper_state, -1),
+            20: partial(self._set_wiper_state, 0),
+            21: partial(self._set_wiper_state, 1),
+            22: partial(self._set_wiper_state, 2),
+            23: partial(self._set_wiper_state, 3),
+        }
+
     def find_moza_device(self) -> Optional[Dict[str, Any]]:
         """Find MOZA Multi-function Stalk device - only exact device name match."""
         try:
@@ -75,8 +149,13 @@ class MOZAStalksMonitor:
             if product_name == target_device_name:
                 print(f"Found target device: {device['product_string']}")
                 print(f"VID: {device['vendor_id']:04x}, PID: {device['product_id']:04x}")
+                self._printed_fallback = False
                 return device
         
+        # Only list the available devices on the first failed attempt
+        if self._printed_fallback:
+            return None
+        self._printed_fallback = True
         print(f"Target device '{target_device_name}' not found. Available HID devices:")
         for device in devices[:10]:  # Show first 10 devices
             print(f"  {device.get('product_string', 'Unknown')} - "
@@ -98,12 +177,13 @@ class MOZAStalksMonitor:
         try:
             self.device = hid.device()
             self.device.open(device_info['vendor_id'], device_info['product_id'])
-            self.device.set_nonblocking(True)
+            self.device.set_nonblocking(False)
             
             self.device_info = device_info
             self.connected = True
             self.read_error_count = 0
-            self.last_state = None  # Reset state on reconnection
+            self._connect_gen += 1  # monitor thread resets its button state on the next frame
+            self._ring.clear()
             
             print(f"Connected to: {device_info['product_string']}")
             return True
@@ -132,90 +212,135 @@ class MOZAStalksMonitor:
             return True
         else:
             print(f"Reconnection failed. Retrying in {self.reconnect_delay} seconds...")
-            time.sleep(self.reconnect_delay)
+            self._stop_event.wait(self.reconnect_delay)
             return False
     
-    def monitor_loop(self):
-        """Main monitoring loop with connection management."""
-        while self.running:
+    def read_loop(self):
+        """Read HID frames into the ring buffer, handling connection management."""
+        last_raw = item = None
+        # bound once; these run for every report
+        stopped = self._stop_event.is_set
+        push = self._ring.append
+        notify = self._frame_ready.set
+        while not stopped():
             try:
                 # Ensure we're connected
                 if not self.connected:
                     if not self.attempt_reconnection():
                         continue
-                
-                # Read device data
-                device_data = self.device.read(64, timeout_ms=50)
-                
-                # Get game data
-                try:
-                    self.data = truck_telemetry.get_data()
-                except Exception as e:
-                    print(f"Error getting telemetry data: {e}")
-                    self.data = None
-                
-                if device_data and self.data:
-                    self.process_device_data(device_data)
-                    self.proccess_game_data()
-                elif device_data:
-                    # Process device data even without game data
-                    self.process_device_data(device_data)
-                
+                    last_raw = None  # tag the next frame with the new generation
+
+                # With a timeout, hidapi waits in the driver for a report whatever the
+                # blocking flag says; the timeout only bounds how long a shutdown
+                # request can go unnoticed
+                device_data = self.device.read(self.report_size, timeout_ms=50)
+                if device_data:
+                    # Reuse the previous frame object while the report is unchanged,
+                    # so idle frames compare by identity and allocate no new bytes
+                    if device_data != last_raw:
+                        last_raw = device_data
+                        item = (self._connect_gen, bytes(device_data))
+                    push(item)
+                    notify()
+
                 # Reset error count on successful read
                 self.read_error_count = 0
-                
+
             except OSError as e:
                 # Device disconnected or communication error
                 self.read_error_count += 1
-                print(f"Device communication error ({self.read_error_count}/{self.max_read_errors}): {e}")
-                
+                log.warning("Device communication error (%d/%d): %s", self.read_error_count, self.max_read_errors, e)
+
                 if self.read_error_count >= self.max_read_errors:
-                    print("Max read errors reached. Device may be disconnected.")
+                    log.warning("Max read errors reached. Device may be disconnected.")
                     self.disconnect()
-                
-                time.sleep(0.1)  # Brief pause before retry
-                
+
+                self._stop_event.wait(0.1)  # Brief pause before retry
+
             except Exception as e:
                 # Other unexpected errors
-                print(f"Unexpected error in monitor loop: {e}")
-                time.sleep(0.1)
-    
+                log.error("Unexpected error in read loop: %s", e)
+                self._stop_event.wait(0.1)
+
+    def monitor_loop(self):
+        """Consume HID frames from the ring buffer and merge them with game data."""
+        frame_gen = None
+        while not self._stop_event.is_set():
+            try:
+                self.release_pulses()
+
+                # Clear before checking the ring so a push in between is never missed
+                self._frame_ready.clear()
+                try:
+                    gen, frame = self._ring.popleft()
+                except IndexError:
+                    # Sleep until the reader pushes a frame or the next pulse is due
+                    timeout = 0.05
+                    if self._pending_releases:
+                        timeout = min(timeout, max(0.0, self._pending_releases[0][0] - time.monotonic()))
+                    self._frame_ready.wait(timeout)
+                    continue
+
+                # First frame of a new connection: diff from scratch, not against
+                # whatever the device reported before it was lost
+                if gen != frame_gen:
+                    frame_gen = gen
+                    self.last_state = None
+
+                self.process_device_data(frame)
+
+                # Get game data
+                try:
+                    self.data = truck_telemetry.get_data()
+                except Exception as e:
+                    log.error("Error getting telemetry data: %s", e)
+                    self.data = None
+
+                if self.data:
+                    self.proccess_game_data()
+
+            except Exception as e:
+                # Other unexpected errors
+                log.error("Unexpected error in monitor loop: %s", e)
+                self._stop_event.wait(0.1)
+
     def process_device_data(self, device_data):
         """Process incoming device_data for button changes."""
+        frame = bytes(device_data)
+        if frame == self.last_state:
+            return
         if self.last_state is None:
-            self.last_state = device_data[:]
+            self.last_state = frame
+            self._last_bits = int.from_bytes(frame, 'little')
             return
-            
-        # Check for changes in the device_data
-        changed = False
-        for i, (old_byte, new_byte) in enumerate(zip(self.last_state, device_data)):
-            if old_byte != new_byte:
-                changed = True
-                # Check each bit for button changes
-                for bit in range(8):
-                    old_bit = (old_byte >> bit) & 1
-                    new_bit = (new_byte >> bit) & 1
-                    
-                    if old_bit != new_bit:
-                        button_id = i * 8 + bit
-                        if new_bit:
-                            print(f"Button {button_id} PRESSED")
-                            self.on_button_press(button_id)
-                        else:
-                            print(f"Button {button_id} RELEASED")
-                            self.on_button_release(button_id)
-            
-        self.last_state = device_data[:]
+
+        # Diff the whole report at once; bit n of the result is button n.
+        # int XOR runs word-at-a-time in C, so this scales with report_size.
+        new_bits = int.from_bytes(frame, 'little')
+        diff = self._last_bits ^ new_bits
+        self.last_state = frame
+        self._last_bits = new_bits
+
+        # Walk only the changed bits, lowest button first
+        debug = log.isEnabledFor(logging.DEBUG)
+        while diff:
+            button_id = (diff & -diff).bit_length() - 1
+            if (new_bits >> button_id) & 1:
+                if debug:
+                    log.debug("Button %d PRESSED", button_id)
+                self.on_button_press(button_id)
+            else:
+                if debug:
+                    log.debug("Button %d RELEASED", button_id)
+                self.on_button_release(button_id)
+            diff &= diff - 1
 
     def proccess_game_data(self):
         """Process game data for indicator auto-disable and wiper speed. this is ran every loop."""
         if not self.data:
             return
 
-        global light_state
-        global wiper_state
-
-        if self.last_turnsignal_time < time.time() - self.switch_cooldown:
+        if time.monotonic() >= self._cooldown_deadline:
             if self.right_cooldown:
                 self.indicator_state = 1
                 self.autodisable = False
@@ -225,10 +350,17 @@ class MOZAStalksMonitor:
                 self.autodisable = False
                 self.left_cooldown = False
             
-        # off edge detection
-        blinker_state = ((self.data.get("blinkerLeftActive", False) and self.data.get("blinkerLeftOn", False) and self.indicator_state == -1) or \
-                        (self.data.get("blinkerRightActive", False) and self.data.get("blinkerRightOn", False) and self.indicator_state == 1) \
-                        and not self.data.get("lightsHazards", False))
+        # fetch all telemetry values used below in one go
+        try:
+            values = _read_blink_keys(self.data)
+        except KeyError:
+            values = [self.data.get(k, False) for k in _BLINK_KEYS]
+        left_active, left_on, right_active, right_on, hazards, lights_parking, lights_beam = values
+
+        # off edge detection; hazards override both sides, so the `or` is grouped explicitly
+        blinker_state = (((left_active and left_on and self.indicator_state == -1) or
+                          (right_active and right_on and self.indicator_state == 1))
+                         and not hazards)
         if self.prev_blinker_state and not blinker_state and self.indicator_state != 0:
             # just turned off, add blink counter
             self.blink_count += 1
@@ -236,18 +368,12 @@ class MOZAStalksMonitor:
                 self.indicator_state = 0
                 self.autodisable = False
                 self.blink_count = 0
-                print("Indicators OFF (auto-disabled)")
+                log.info("Indicators OFF (auto-disabled)")
 
         self.prev_blinker_state = blinker_state
 
         # send data to game with error handling - FIXED LOGIC
         try:
-            # Get current game indicator states
-            left_active = self.data.get("blinkerLeftActive", False)
-            right_active = self.data.get("blinkerRightActive", False)
-            left_on = self.data.get("blinkerLeftOn", False)
-            right_on = self.data.get("blinkerRightOn", False)
-            
             # Determine what the indicators should be based on our desired state
             left_should_be_active = (self.indicator_state == -1)
             right_should_be_active = (self.indicator_state == 1)
@@ -275,20 +401,15 @@ class MOZAStalksMonitor:
                 if right_active:
                     rblinker_should_set = True
             
-            # Send the commands only if needed
+            # Collect the outputs to press this frame; they are sent together below
+            presses = []
             if (lblinker_should_set or rblinker_should_set) and not (left_on or right_on):
-                setattr(controller, 'lblinker', lblinker_should_set)
-                setattr(controller, 'rblinker', rblinker_should_set)
-                time.sleep(0.05)
-                setattr(controller, 'lblinker', False)
-                setattr(controller, 'rblinker', False)
-                print(f"Set indicators - Left: {lblinker_should_set}, Right: {rblinker_should_set}")
+                if lblinker_should_set:
+                    presses.append('lblinker')
+                if rblinker_should_set:
+                    presses.append('rblinker')
 
-            
             # Handle lights
-            lights_parking = self.data.get("lightsParking", False)
-            lights_beam = self.data.get("lightsBeamLow", False)
-            
             if lights_beam:
                 current_light_state = 2
             elif lights_parking:
@@ -296,126 +417,114 @@ class MOZAStalksMonitor:
             else:
                 current_light_state = 0
 
-            if current_light_state != light_state:
-                setattr(controller, 'light', True)
-                time.sleep(0.05)
-                setattr(controller, 'light', False)
-                time.sleep(0.05)
+            if current_light_state != self.light_state:
+                presses.append('light')
         
             # Wipers
-            if self.rain_sensor and wiper_state == 0:
-                # set to sensor mode
-                print("Wipers: sensor mode (rain sensor active, wiper_state=0)")
-                self.reset_wipers()
-                setattr(controller, 'wipersback', True)
+            if self.rain_sensor and self.wiper_state == 0:
+                desired = _WIPER_SENSOR
             else:
-                print("Wipers: not in sensor mode, resetting wipers")
-                setattr(controller, 'wipersback', False)
-
-            if wiper_state == 0 and not self.rain_sensor:
-                # off
-                print("Wipers: off (wiper_state=0, rain sensor inactive)")
-                self.reset_wipers()
-                setattr(controller, 'tripreset', True)
-            elif wiper_state == 1:
-                # intermittent
-                print("Wipers: intermittent (wiper_state=1)")
-                self.reset_wipers()
-                setattr(controller, 'wipersback', True)
-            elif wiper_state == 2:
-                # low
-                print("Wipers: low (wiper_state=2)")
-                self.reset_wipers()
-                setattr(controller, 'wipers0', True)
-            elif wiper_state == 3:
-                # high
-                print("Wipers: high (wiper_state=3)")
-                self.reset_wipers()
-                setattr(controller, 'wipers1', True)
-            elif wiper_state == -1:
-                # manual slow wiping
-                print("Wipers: manual slow wipe (wiper_state=-1)")
-                self.reset_wipers()
-                setattr(controller, 'wipers0', True)
+                desired = _WIPER_MAP[self.wiper_state]
+            log.debug("Wipers: wiper_state=%d, rain_sensor=%s", self.wiper_state, self.rain_sensor)
+
+            # One controller write per frame for wipers and all pulse presses
+            pressed = self.schedule_pulse(presses) if presses else ()
+            if pressed:
+                desired = {**desired, **dict.fromkeys(pressed, True)}
+            self.write_controller(desired)
+            if 'lblinker' in pressed or 'rblinker' in pressed:
+                log.info("Set indicators - Left: %s, Right: %s", lblinker_should_set, rblinker_should_set)
                 
         except Exception as e:
-            print(f"Error sending controller data: {e}")
+            log.error("Error sending controller data: %s", e)
 
-    def reset_wipers(self):
-        """Reset wipers SDK outputs to false."""
-        setattr(controller, 'wipersback', False)
-        setattr(controller, 'wipers0', False)
-        setattr(controller, 'wipers1', False)
-        setattr(controller, 'tripreset', False)
+    def write_controller(self, desired):
+        """Write controller outputs, skipping any that already hold the desired value."""
+        changed = {key: value for key, value in desired.items() if self._ctrl_state[key] != value}
+        if changed:
+            controller.update(changed)
+            self._ctrl_state.update(changed)
+
+    def schedule_pulse(self, attrs, duration=0.05):
+        """Schedule one batched release for controller outputs about to be pressed.
+
+        Outputs whose previous pulse has not finished yet are skipped, which also
+        leaves the game one pulse length to register the release. Returns the
+        outputs the caller should set to True.
+        """
+        now = time.monotonic()
+        ready = [attr for attr in attrs if now >= self._pulse_ready.get(attr, 0)]
+        if ready:
+            heapq.heappush(self._pending_releases, (now + duration, ready))
+            for attr in ready:
+                self._pulse_ready[attr] = now + 2 * duration
+        return ready
+
+    def release_pulses(self, release_all=False):
+        """Release pulsed controller outputs whose duration has elapsed, or all of them."""
+        if not self._pending_releases:
+            return
+        now = float('inf') if release_all else time.monotonic()
+        if self._pending_releases[0][0] > now:
+            return
+        due = {}
+        while self._pending_releases and self._pending_releases[0][0] <= now:
+            due.update(dict.fromkeys(heapq.heappop(self._pending_releases)[1], False))
+        self.write_controller(due)
 
     def on_button_press(self, button_id):
         """Called when a button is pressed. Override this method."""
-        global light_state
-        global wiper_state
-
-        passed_cooldown = (time.time() - self.last_turnsignal_time) > self.switch_cooldown
-
-        # Handle indicators
-        if button_id == 7:
-            # Right indicator
-            if not passed_cooldown:
-                print("Turn signal change ignored due to cooldown")
-                self.right_cooldown = True
-                return
-            if self.indicator_state != 1:  # Reset count when changing to right from any other state
-                self.blink_count = 0
-                self.prev_blinker_state = False  # Reset blinker state tracking
-            self.indicator_state = 1
-            self.autodisable = False
-            print("Right indicator ON")
-        elif button_id == 9:
-            # Left indicator
-            if not passed_cooldown:
-                print("Turn signal change ignored due to cooldown")
-                self.left_cooldown = True
-                return
-            if self.indicator_state != -1:  # Reset count when changing to left from any other state
-                self.blink_count = 0
-                self.prev_blinker_state = False  # Reset blinker state tracking
-            self.indicator_state = -1
+        handler = self._button_handlers.get(button_id)
+        if handler:
+            handler()
+
+    def _btn_right(self):
+        """Right indicator."""
+        if time.monotonic() < self._cooldown_deadline:
+            log.info("Turn signal change ignored due to cooldown")
+            self.right_cooldown = True
+            return
+        if self.indicator_state != 1:  # Reset count when changing to right from any other state
+            self.blink_count = 0
+            self.prev_blinker_state = False  # Reset blinker state tracking
+        self.indicator_state = 1
+        self.autodisable = False
+        log.info("Right indicator ON")
+
+    def _btn_left(self):
+        """Left indicator."""
+        if time.monotonic() < self._cooldown_deadline:
+            log.info("Turn signal change ignored due to cooldown")
+            self.left_cooldown = True
+            return
+        if self.indicator_state != -1:  # Reset count when changing to left from any other state
+            self.blink_count = 0
+            self.prev_blinker_state = False  # Reset blinker state tracking
+        self.indicator_state = -1
+        self.autodisable = False
+        log.info("Left indicator ON")
+
+    def _btn_cancel(self):
+        """Indicator stalk returned to center."""
+        self._cooldown_deadline = time.monotonic() + self.switch_cooldown
+        self.left_cooldown = False
+        self.right_cooldown = False
+        # disable indicators
+        if self.blink_count < self.autodisable_threshold:
+            self.autodisable = True
+            log.info("Indicators kept active")
+        else:
             self.autodisable = False
-            print("Left indicator ON")
-        elif button_id == 8:
-            self.last_turnsignal_time = time.time()
-            self.left_cooldown = False
-            self.right_cooldown = False
-            # disable indicators
-            if self.blink_count < self.autodisable_threshold:
-                self.autodisable = True
-                print("Indicators kept active")
-            else:
-                self.autodisable = False
-                self.indicator_state = 0
-                self.blink_count = 0
-                self.prev_blinker_state = False  # Reset blinker state tracking
-                print("Indicators OFF")
-
-        # Handle lights        
-        elif button_id == 0:
-            # off
-            light_state = 0
-        elif button_id == 1:
-            # parking
-            light_state = 1
-        elif button_id == 2:
-            # low beam
-            light_state = 2
-
-        elif button_id == 19:
-            wiper_state = -1
-        elif button_id == 20:
-            wiper_state = 0
-        elif button_id == 21:
-            wiper_state = 1
-        elif button_id == 22:
-            wiper_state = 2
-        elif button_id == 23:
-            wiper_state = 3
+            self.indicator_state = 0
+            self.blink_count = 0
+            self.prev_blinker_state = False  # Reset blinker state tracking
+            log.info("Indicators OFF")
+
+    def _set_light_state(self, state):
+        self.light_state = state
+
+    def _set_wiper_state(self, state):
+        self.wiper_state = state
 
     def on_button_release(self, button_id):
         """Called when a button is released. Override this method."""
@@ -430,9 +539,12 @@ class MOZAStalksMonitor:
             print("Initial connection failed. Will attempt to reconnect automatically.")
         
         self.running = True
-        self.thread = threading.Thread(target=self.monitor_loop, daemon=True)
+        self._stop_event.clear()
+        self.reader_thread = threading.Thread(target=self.read_loop, name="HID reader", daemon=True)
+        self.thread = threading.Thread(target=self.monitor_loop, name="Monitor", daemon=True)
+        self.reader_thread.start()
         self.thread.start()
-        print("Monitoring started. Press buttons to see events.")
+        print("Monitoring started. Run with --debug to see button events.")
         print("Device will automatically reconnect if disconnected.")
         return True
     
@@ -440,15 +552,30 @@ class MOZAStalksMonitor:
         """Stop monitoring."""
         print("Stopping monitor...")
         self.running = False
+        self._stop_event.set()
+        self._frame_ready.set()  # wake the monitor thread
         
-        if self.thread:
-            self.thread.join(timeout=3)
-            if self.thread.is_alive():
-                print("Warning: Monitor thread did not stop gracefully")
+        for thread in (self.reader_thread, self.thread):
+            if thread:
+                thread.join(timeout=3)
+                if thread.is_alive():
+                    print(f"Warning: {thread.name} did not stop gracefully")
+
+        # Release pulses still held so the game doesn't see them stuck on. Only
+        # once the monitor thread is gone, so the two never write at the same time.
+        if not (self.thread and self.thread.is_alive()):
+            try:
+                self.release_pulses(release_all=True)
+            except Exception as e:
+                log.error("Error releasing controller outputs: %s", e)
         
         self.disconnect()
         print("Monitoring stopped.")
 
+    def wait(self, timeout=None) -> bool:
+        """Block until monitoring is stopped or the timeout expires. Returns True if stopped."""
+        return self._stop_event.wait(timeout)
+
     def get_status(self) -> Dict[str, Any]:
         """Get current connection status."""
         return {
@@ -462,6 +589,10 @@ class MOZAStalksMonitor:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="MOZA Multi-function Stalks controller for ETS2/ATS")
+    parser.add_argument("--debug", action="store_true", help="log every button event and wiper update")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format="%(message)s")
     monitor = MOZAStalksMonitor()
     
     while 1:
@@ -478,17 +609,14 @@ def main():
                 
                 # Status reporting loop
                 last_status_time = 0
-                while True:
-                    current_time = time.time()
+                while not monitor.wait(1):
+                    current_time = time.monotonic()
                     
                     # Print status every 15 seconds if not connected
                     if current_time - last_status_time > 15:
-                        status = monitor.get_status()
-                        if not status['connected']:
+                        if not monitor.connected:
                             print(f"Status: Device disconnected - scanning for device every {monitor.reconnect_delay}s...")
                         last_status_time = current_time
-                    
-                    time.sleep(1)
             else:
                 print("\nInitial connection failed, but monitoring started.")
                 print("The device will be detected automatically when connected.")
@@ -499,6 +627,7 @@ def main():
             
         except KeyboardInterrupt:
             print("\nShutting down...")
+            break
         finally:
             monitor.stop()
 
@@ -3,7 +3,7 @@ import platform
 import struct
 import sys
 
-from typing import Dict
+from typing import Any, Dict
 
 
 # https://docs.python.org/3/whatsnew/3.7.html
@@ -75,12 +75,15 @@ class SCSController:
     def __init__(self):
         shm_size = 0
         self._shm_offsets: Dict[str, int] = {}
+        self._shm_formats: Dict[str, str] = {}
         for i, t in SCSController.__annotations__.items():
             self._shm_offsets[i] = shm_size
 
             if t is bool:
+                self._shm_formats[i] = "?"
                 shm_size += self._BOOL_SIZE
             elif t is float:
+                self._shm_formats[i] = "f"
                 shm_size += self._FLOAT_SIZE
 
         system = platform.system()
@@ -106,6 +109,19 @@ class SCSController:
         except:
             pass
 
+    def update(self, values: Dict[str, Any]):
+        """Write several inputs in place and flush the shared memory once."""
+        for key, value in values.items():
+            expected_type = SCSController.__annotations__.get(key)
+            if expected_type is None:
+                raise AttributeError(f"'{key}' input is not known")
+            if type(value) is not expected_type:
+                raise TypeError(f"'{key}' must be of type '{expected_type}'")
+
+            struct.pack_into(self._shm_formats[key], self._shm_buff, self._shm_offsets[key], value)
+
+        self._shm_buff.flush()
+
     def __enter__(self):
         return self
 
@@ -129,20 +145,4 @@ class SCSController:
         if not self._initialized:
             return super().__setattr__(key, value)
 
-        if key not in SCSController.__annotations__:
-            raise AttributeError(f"'{key}' input is not known")
-
-        value_type = type(value)
-        expected_type = SCSController.__annotations__[key]
-        if value_type is not expected_type:
-            raise TypeError(f"'{key}' must be of type '{expected_type}'")
-
-        self._shm_buff.seek(self._shm_offsets[key])
-        if value_type is bool:
-            self._shm_buff.write(struct.pack("?", value))
-        elif value_type is float:
-            self._shm_buff.write(struct.pack("f", value))
-        else:
-            raise TypeError(f"'{value_type}' type is not supported")
-
-        self._shm_buff.flush()
+        self.update({key: value})